@@ -1,12 +1,25 @@
+import os
 import re
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 import generate  # noqa: E402
 
 
+def make_preset(category: str, description: str, env_token: str) -> generate.Preset:
+    return generate.Preset(
+        display_name="Demo",
+        api_url="https://api.demo.com",
+        env_token=env_token,
+        category=category,
+        description=description,
+    )
+
+
 def test_to_pascal_case() -> None:
     assert generate.to_pascal_case("slack") == "Slack"
     assert generate.to_pascal_case("foo_bar") == "FooBar"
@@ -31,10 +44,20 @@ def test_render_template_replaces_tokens() -> None:
     assert generate.render_template(template, context) == "Hello Ada from FGP!"
 
 
+def test_render_template_keeps_unknown_tokens() -> None:
+    template = "{{name}} uses {{missing}}"
+    assert generate.render_template(template, {"name": "Ada"}) == "Ada uses {{missing}}"
+
+
+def test_render_template_allows_padded_tokens() -> None:
+    template = "{{ name }} and {{\tname}} keep {{ missing }}"
+    assert generate.render_template(template, {"name": "Ada"}) == "Ada and Ada keep {{ missing }}"
+
+
 def test_print_presets_output(capsys) -> None:
     presets = {
-        "slack": {"category": "Communication", "description": "Chat", "env_token": "SLACK_TOKEN"},
-        "notion": {"category": "Knowledge", "description": "Docs", "env_token": "NOTION_TOKEN"},
+        "slack": make_preset("Communication", "Chat", "SLACK_TOKEN"),
+        "notion": make_preset("Knowledge", "Docs", "NOTION_TOKEN"),
     }
     generate.print_presets(presets)
     output = capsys.readouterr().out
@@ -43,3 +66,73 @@ def test_print_presets_output(capsys) -> None:
     assert "Knowledge" in output
     assert "slack" in output
     assert "notion" in output
+
+
+def test_compile_template_escapes_literal_braces() -> None:
+    assert generate.compile_template("fn {{x}}() {}") == "fn {x}() {{}}"
+    assert generate.render_template("fn {{x}}() {}", {"x": "main"}) == "fn main() {}"
+
+
+def test_load_presets_is_cached() -> None:
+    presets = generate.load_presets()
+    assert presets is generate.load_presets()
+    assert presets["slack"].env_token == "SLACK_TOKEN"
+
+
+def test_print_presets_orders_categories(capsys) -> None:
+    presets = {
+        "zapier": make_preset("Unlisted", "Misc", "Z_TOKEN"),
+        "stripe": make_preset("Payments", "Pay", "S_TOKEN"),
+        "slack": make_preset("Communication", "Chat", "SLACK_TOKEN"),
+    }
+    generate.print_presets(presets)
+    output = capsys.readouterr().out
+    assert output.index("Communication") < output.index("Payments") < output.index("Unlisted")
+
+
+def test_create_daemon_uses_given_date(tmp_path: Path, capsys) -> None:
+    generate.create_daemon(
+        service_name="demo",
+        display_name="Demo",
+        api_base_url="https://api.demo.com",
+        env_token="DEMO_TOKEN",
+        author="Ada",
+        output_dir=tmp_path,
+        date="01/02/2003",
+    )
+    cargo = (tmp_path / "demo" / "Cargo.toml").read_text(encoding="utf-8")
+    assert "01/02/2003 - Initial implementation (Ada)" in cargo
+    assert (tmp_path / "demo" / "src" / "api" / "client.rs").is_file()
+    assert "Daemon 'demo' created successfully!" in capsys.readouterr().out
+
+
+def test_presets_use_known_categories() -> None:
+    unknown = {
+        name: preset.category
+        for name, preset in generate.load_presets().items()
+        if preset.category not in generate._CATEGORY_RANK
+    }
+    assert unknown == {}
+
+
+def test_load_template_rereads_on_mtime_change(tmp_path: Path) -> None:
+    template = tmp_path / "demo.template"
+    template.write_text("one", encoding="utf-8")
+    assert generate.load_template(str(template)) == "one"
+
+    template.write_text("two", encoding="utf-8")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert generate.load_template(str(template)) == "two"
+
+
+def test_load_presets_is_read_only() -> None:
+    with pytest.raises(TypeError):
+        generate.load_presets()["new"] = {}
+
+
+def test_print_presets_defaults_to_builtin(capsys) -> None:
+    generate.print_presets()
+    output = capsys.readouterr().out
+    assert f"{len(generate.load_presets())} Service Presets Available" in output
+    assert generate.presets_by_category() is generate.presets_by_category()
@@ -3,11 +3,22 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import io
 import json
+import operator
+import os
+import re
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Set
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON output when installed
+    orjson = None
 
 DOCTRINE_CANDIDATES = [
     "DOCTRINE.md",
@@ -39,6 +50,10 @@ LANG_MARKERS = {
     "go": ["go.mod"],
 }
 
+MARKER_TO_LANG = {
+    marker: lang for lang, markers in LANG_MARKERS.items() for marker in markers
+}
+
 DEFAULT_REQUIRED_HEADINGS = [
     "Purpose",
     "Scope",
@@ -61,6 +76,11 @@ DEFAULT_EXCLUDES = {
     "notes",
 }
 
+# A markdown heading line: leading #s, then the non-empty heading text with
+# surrounding whitespace trimmed. [^\S\n] is whitespace that stays on the line.
+HEADING_RE = re.compile(r"^[^\S\n]*#+(?!#)[^\S\n]*(\S.*?)[^\S\n]*$", re.MULTILINE)
+WHITESPACE_RE = re.compile(r"\s+")
+
 
 @dataclass(frozen=True)
 class ModuleRecord:
@@ -75,6 +95,14 @@ class ModuleRecord:
     missing_headings: List[str]
 
 
+RECORD_FIELDS = tuple(field.name for field in fields(ModuleRecord))
+record_values = operator.attrgetter(*RECORD_FIELDS)
+
+
+def record_to_dict(record: ModuleRecord) -> dict:
+    return dict(zip(RECORD_FIELDS, record_values(record)))
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Inventory doctrine coverage across top-level modules."
@@ -124,23 +152,39 @@ def repo_root_from_script() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def is_module_dir(path: Path) -> bool:
-    if not path.is_dir():
-        return False
-    if path.name.startswith("."):
-        return False
-    for marker in MODULE_MARKERS:
-        if (path / marker).exists():
-            return True
-    return False
+def list_names(path: Path) -> Set[str]:
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def has_module_marker(path: Path) -> bool:
+    names = list_names(path)
+    return any(marker in names for marker in MODULE_MARKERS)
+
+
+def find_modules(root: Path, excludes: Iterable[str]) -> List[Path]:
+    # One scandir pass: excluded and hidden names are skipped before any stat,
+    # and the directory check uses the cached entry type.
+    modules = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name in excludes or entry.name.startswith("."):
+                continue
+            if not entry.is_dir():
+                continue
+            path = Path(entry.path)
+            if has_module_marker(path):
+                modules.append(path)
+    return modules
 
 
 def detect_languages(path: Path) -> List[str]:
-    languages = []
-    for lang, markers in LANG_MARKERS.items():
-        if any((path / marker).exists() for marker in markers):
-            languages.append(lang)
-    return languages
+    names = list_names(path)
+    found = {lang for marker, lang in MARKER_TO_LANG.items() if marker in names}
+    return [lang for lang in LANG_MARKERS if lang in found]
 
 
 def read_text(path: Path) -> str:
@@ -150,61 +194,104 @@ def read_text(path: Path) -> str:
         return path.read_text(encoding="utf-8", errors="ignore")
 
 
+@functools.lru_cache(maxsize=256)
+def _read_text_at(path: str, mtime_ns: int) -> str:
+    return read_text(Path(path))
+
+
+def read_text_cached(path: Path) -> str:
+    return _read_text_at(str(path), path.stat().st_mtime_ns)
+
+
 def extract_headings(text: str) -> List[str]:
-    headings = []
-    for line in text.splitlines():
-        line = line.strip()
-        if line.startswith("#"):
-            parts = line.lstrip("#").strip()
-            if parts:
-                headings.append(parts)
-    return headings
+    return HEADING_RE.findall(text)
+
+
+def is_doctrine_name(name: str) -> bool:
+    return name.endswith(".md") and "doctrine" in name
+
+
+def iter_doctrine_files(module_path: str) -> Iterator[str]:
+    # *doctrine*.md at the module root and anywhere under docs/, matched on
+    # scandir entry names so non-matching files never become Path objects.
+    stack = [(module_path, True)]
+    while stack:
+        directory, at_root = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if at_root:
+                            # docs/ itself may be a shared symlink; links
+                            # below it are not followed
+                            descend = entry.name == "docs"
+                        else:
+                            descend = not entry.is_symlink() and not entry.name.startswith(".")
+                        if descend:
+                            stack.append((entry.path, False))
+                    elif is_doctrine_name(entry.name):
+                        yield entry.path
+        except OSError:
+            continue
 
 
 def find_doctrine_files(module_path: Path) -> List[Path]:
     found_map = {}
 
-    def add_path(path: Path) -> None:
-        try:
-            key = str(path.resolve()).lower()
-        except FileNotFoundError:
-            key = str(path).lower()
+    def add_path(path: str) -> None:
+        # Lower-cased so case variants on case-insensitive filesystems dedupe
+        key = os.path.normpath(path).lower()
         if key not in found_map:
-            found_map[key] = path
+            found_map[key] = Path(path)
 
+    root = str(module_path)
     for rel in DOCTRINE_CANDIDATES:
-        candidate = module_path / rel
-        if candidate.exists():
+        candidate = os.path.join(root, rel)
+        if os.path.exists(candidate):
             add_path(candidate)
 
-    docs_dir = module_path / "docs"
-    if docs_dir.exists():
-        for path in docs_dir.rglob("*doctrine*.md"):
-            add_path(path)
-
-    root_matches = list(module_path.glob("*doctrine*.md"))
-    for path in root_matches:
+    for path in iter_doctrine_files(root):
         add_path(path)
 
     return sorted(found_map.values())
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_heading(name: str) -> str:
-    return " ".join(name.split()).strip().lower()
+    return WHITESPACE_RE.sub(" ", name).strip().lower()
 
 
-def build_record(module_path: Path, required_headings: Iterable[str]) -> ModuleRecord:
+def unmatched_headings(doctrine_files: Iterable[Path], required: Iterable[str]) -> Set[str]:
+    # Normalized required headings not found; stops reading once all are seen
+    remaining = {normalize_heading(h) for h in required}
+    for doc in doctrine_files:
+        if not remaining:
+            break
+        for match in HEADING_RE.finditer(read_text_cached(doc)):
+            remaining.discard(normalize_heading(match.group(1)))
+            if not remaining:
+                break
+    return remaining
+
+
+def build_record(
+    module_path: Path, required_headings: Iterable[str], collect_headings: bool = True
+) -> ModuleRecord:
     doctrine_files = find_doctrine_files(module_path)
+    required = [h for h in required_headings if h]
     headings: List[str] = []
-    for doc in doctrine_files:
-        headings.extend(extract_headings(read_text(doc)))
 
-    normalized = {normalize_heading(h) for h in headings}
-    required = [h for h in required_headings if h]
-    missing = []
-    for heading in required:
-        if normalize_heading(heading) not in normalized:
-            missing.append(heading)
+    if collect_headings:
+        # One regex pass over all files; the newline keeps files on separate lines
+        combined = "\n".join(read_text_cached(doc) for doc in doctrine_files)
+        # Dedupe in document order; one pass instead of set + sort
+        headings = list(dict.fromkeys(extract_headings(combined)))
+        normalized = {normalize_heading(h) for h in headings}
+        missing = [h for h in required if normalize_heading(h) not in normalized]
+    else:
+        # Only missing headings are needed, so allow an early exit
+        unmatched = unmatched_headings(doctrine_files, required)
+        missing = [h for h in required if normalize_heading(h) in unmatched]
 
     return ModuleRecord(
         name=module_path.name,
@@ -214,11 +301,26 @@ def build_record(module_path: Path, required_headings: Iterable[str]) -> ModuleR
         has_docs_dir=(module_path / "docs").exists(),
         has_src_dir=(module_path / "src").exists(),
         doctrine_files=[str(p.relative_to(module_path)) for p in doctrine_files],
-        headings=sorted(set(headings)),
+        headings=headings,
         missing_headings=missing,
     )
 
 
+def dumps_json(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+YES_NO = ("no", "yes")
+
+
+@functools.lru_cache(maxsize=128)
+def join_cell(values: tuple) -> str:
+    # Modules commonly share language sets and file lists; reuse the joined cell
+    return ", ".join(values) if values else "-"
+
+
 def to_markdown(rows: List[ModuleRecord], include_headings: bool) -> str:
     header = [
         "Module",
@@ -231,25 +333,24 @@ def to_markdown(rows: List[ModuleRecord], include_headings: bool) -> str:
     if include_headings:
         header.append("Missing Headings")
 
-    lines = ["| " + " | ".join(header) + " |", "|" + "|".join([" --- "] * len(header)) + "|"]
+    buf = io.StringIO()
+    buf.write("| " + " | ".join(header) + " |\n")
+    buf.write("|" + "|".join([" --- "] * len(header)) + "|\n")
 
     for row in rows:
-        doctrine_files = ", ".join(row.doctrine_files) if row.doctrine_files else "-"
-        missing = ", ".join(row.missing_headings) if row.missing_headings else "-"
-        langs = ", ".join(row.languages) if row.languages else "-"
         cells = [
             row.name,
-            langs,
-            "yes" if row.has_readme else "no",
-            "yes" if row.has_docs_dir else "no",
-            "yes" if row.has_src_dir else "no",
-            doctrine_files,
+            join_cell(tuple(row.languages)),
+            YES_NO[row.has_readme],
+            YES_NO[row.has_docs_dir],
+            YES_NO[row.has_src_dir],
+            join_cell(tuple(row.doctrine_files)),
         ]
         if include_headings:
-            cells.append(missing)
-        lines.append("| " + " | ".join(cells) + " |")
+            cells.append(join_cell(tuple(row.missing_headings)))
+        buf.write("| " + " | ".join(cells) + " |\n")
 
-    return "\n".join(lines) + "\n"
+    return buf.getvalue()
 
 
 def write_csv(rows: List[ModuleRecord], out, delimiter: str) -> None:
@@ -296,18 +397,27 @@ def main() -> int:
     if args.required_headings:
         required_headings.extend(args.required_headings)
 
-    modules = [
-        path for path in root.iterdir() if path.name not in excludes and is_module_dir(path)
-    ]
-    records = [
-        build_record(path, required_headings) for path in sorted(modules, key=lambda p: p.name)
-    ]
+    modules = find_modules(root, excludes)
+    # Records are I/O-bound; executor.map keeps them in module order
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        records = list(
+            executor.map(
+                functools.partial(
+                    build_record,
+                    required_headings=required_headings,
+                    # Markdown output does not list the headings themselves
+                    collect_headings=args.format != "markdown",
+                ),
+                sorted(modules, key=lambda p: p.name),
+            )
+        )
 
     output = ""
     if args.format == "markdown":
         output = to_markdown(records, include_headings=bool(required_headings))
     elif args.format == "json":
-        output = json.dumps([record.__dict__ for record in records], indent=2)
+        output = dumps_json([record_to_dict(record) for record in records])
     elif args.format in {"csv", "tsv"}:
         delimiter = "," if args.format == "csv" else "\t"
         stream = open(args.out, "w", newline="", encoding="utf-8") if args.out else sys.stdout
@@ -2,51 +2,88 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
+import fnmatch
+import functools
 import json
+import os
+import re
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Sequence
-
-MODULE_MARKERS = [
-    "README.md",
-    "Cargo.toml",
-    "pyproject.toml",
-    "package.json",
-    "go.mod",
-    "requirements.txt",
-    "src",
-]
-
-LANG_MARKERS = {
-    "rust": ["Cargo.toml"],
-    "python": ["pyproject.toml", "requirements.txt"],
-    "node": ["package.json"],
-    "go": ["go.mod"],
-}
-
-DEFAULT_EXCLUDES = {
-    ".git",
-    "Plans",
-    "docs",
-    "logs",
-    "notes",
-    "target",
-    "node_modules",
-    "dist",
-    "build",
-}
-
-PYTHON_TEST_GLOBS = ["test_*.py", "*_test.py"]
-NODE_TEST_GLOBS = ["*.test.js", "*.test.jsx", "*.test.ts", "*.test.tsx", "*.spec.js", "*.spec.jsx", "*.spec.ts", "*.spec.tsx"]
-GO_TEST_GLOBS = ["*_test.go"]
-
-RUST_INLINE_MARKERS = ["#[test]", "#[tokio::test]", "#[cfg(test)]", "mod tests"]
-
-
-@dataclass(frozen=True)
-class ModuleRecord:
+from types import MappingProxyType
+from typing import Iterable, List, NamedTuple, Set
+
+MODULE_MARKERS = frozenset(
+    {
+        "README.md",
+        "Cargo.toml",
+        "pyproject.toml",
+        "package.json",
+        "go.mod",
+        "requirements.txt",
+        "src",
+    }
+)
+
+LANG_MARKERS = MappingProxyType(
+    {
+        "rust": ("Cargo.toml",),
+        "python": ("pyproject.toml", "requirements.txt"),
+        "node": ("package.json",),
+        "go": ("go.mod",),
+    }
+)
+
+MARKER_TO_LANG = MappingProxyType(
+    {marker: lang for lang, markers in LANG_MARKERS.items() for marker in markers}
+)
+
+DEFAULT_EXCLUDES = frozenset(
+    {
+        ".git",
+        "Plans",
+        "docs",
+        "logs",
+        "notes",
+        "target",
+        "node_modules",
+        "dist",
+        "build",
+    }
+)
+
+PYTHON_TEST_GLOBS = ("test_*.py", "*_test.py")
+NODE_TEST_GLOBS = ("*.test.js", "*.test.jsx", "*.test.ts", "*.test.tsx", "*.spec.js", "*.spec.jsx", "*.spec.ts", "*.spec.tsx")
+GO_TEST_GLOBS = ("*_test.go",)
+
+TEST_DIRS = frozenset({"tests", "test", "__tests__"})
+
+# Any file name matching one of the test globs above, compiled once
+TEST_FILE_RE = re.compile(
+    "|".join(
+        fnmatch.translate(pattern)
+        for pattern in PYTHON_TEST_GLOBS + NODE_TEST_GLOBS + GO_TEST_GLOBS
+    )
+)
+
+RUST_INLINE_MARKERS = (b"#[test]", b"#[tokio::test]", b"#[cfg(test)]", b"mod tests")
+
+# All Rust inline markers in one pattern, matched against raw file bytes
+RUST_MARKER_RE = re.compile(b"|".join(map(re.escape, RUST_INLINE_MARKERS)))
+
+READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+NOATIME_READ_FLAGS = READ_FLAGS | getattr(os, "O_NOATIME", 0)
+READ_CHUNK_SIZE = 1 << 16
+RUST_MARKER_OVERLAP = max(map(len, RUST_INLINE_MARKERS)) - 1
+
+# Larger Rust sources are usually generated; test modules are scanned anyway
+MAX_SCAN_BYTES = 512 * 1024
+RUST_TEST_SOURCE_SUFFIXES = ("tests.rs", "_test.rs")
+
+
+class ModuleRecord(NamedTuple):
     name: str
     path: str
     languages: List[str]
@@ -56,6 +93,16 @@ class ModuleRecord:
     rust_inline_tests: int
 
 
+def non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {value}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Inventory unit test coverage across top-level modules."
@@ -92,6 +139,20 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Include test file list in markdown output.",
     )
+    parser.add_argument(
+        "--max-scan-bytes",
+        type=non_negative_int,
+        default=MAX_SCAN_BYTES,
+        help="Skip larger Rust sources when counting inline tests, unless named "
+        "like a test module. 0 scans every file.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=non_negative_int,
+        default=None,
+        help="Scan modules in this many worker processes instead of threads "
+        "(0 uses one per CPU).",
+    )
     return parser.parse_args()
 
 
@@ -99,104 +160,147 @@ def repo_root_from_script() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def is_module_dir(path: Path) -> bool:
-    if not path.is_dir():
-        return False
-    if path.name.startswith("."):
+def has_module_marker(path: str) -> bool:
+    # Stops reading the listing at the first marker name
+    try:
+        with os.scandir(path) as entries:
+            return any(entry.name in MODULE_MARKERS for entry in entries)
+    except OSError:
         return False
-    for marker in MODULE_MARKERS:
-        if (path / marker).exists():
-            return True
-    return False
 
 
-def detect_languages(path: Path) -> List[str]:
-    languages = []
-    for lang, markers in LANG_MARKERS.items():
-        if any((path / marker).exists() for marker in markers):
-            languages.append(lang)
-    return languages
+def find_modules(root: Path, excludes: Iterable[str]) -> List[Path]:
+    # One scandir pass over the root; the directory check uses the cached
+    # entry type and each candidate is scanned once for its markers.
+    modules = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name in excludes or entry.name.startswith("."):
+                continue
+            if not entry.is_dir():
+                continue
+            if has_module_marker(entry.path):
+                modules.append(Path(entry.path))
+    return modules
 
 
-def is_excluded(path: Path, excludes: Iterable[str]) -> bool:
-    return any(part in excludes for part in path.parts)
+def languages_from_names(names: Set[str]) -> List[str]:
+    found = {lang for marker, lang in MARKER_TO_LANG.items() if marker in names}
+    # Report languages in LANG_MARKERS order
+    return [lang for lang in LANG_MARKERS if lang in found]
 
 
-def read_text(path: Path) -> str:
+def open_for_scan(path: str) -> int:
+    # O_NOATIME avoids an atime write per scanned file, but the kernel refuses
+    # it for files owned by someone else, so retry those without it.
     try:
-        return path.read_text(encoding="utf-8")
-    except Exception:
-        return path.read_text(encoding="utf-8", errors="ignore")
+        return os.open(path, NOATIME_READ_FLAGS)
+    except PermissionError:
+        return os.open(path, READ_FLAGS)
 
 
-def glob_files(root: Path, patterns: Sequence[str], excludes: Iterable[str]) -> List[Path]:
-    found: List[Path] = []
-    for pattern in patterns:
-        for path in root.rglob(pattern):
-            if is_excluded(path, excludes):
-                continue
-            if path.is_file():
-                found.append(path)
-    return found
-
-
-def rust_inline_test_count(module_path: Path, excludes: Iterable[str]) -> int:
-    src_dir = module_path / "src"
-    if not src_dir.exists():
-        return 0
-    count = 0
-    for path in src_dir.rglob("*.rs"):
-        if is_excluded(path, excludes):
+def has_rust_test_marker(path: str) -> bool:
+    # Read in chunks and stop at the first marker; the tail of each window is
+    # carried over so a marker split across two reads is still found.
+    fd = open_for_scan(path)
+    try:
+        tail = b""
+        while True:
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk:
+                return False
+            window = tail + chunk
+            if RUST_MARKER_RE.search(window):
+                return True
+            tail = window[-RUST_MARKER_OVERLAP:]
+    finally:
+        os.close(fd)
+
+
+def scan_module(
+    module_path: Path,
+    excludes: Iterable[str],
+    max_scan_bytes: int = MAX_SCAN_BYTES,
+    sort_test_files: bool = True,
+) -> ModuleRecord:
+    # Single walk per module: the top-level listing answers the README,
+    # language and tests-dir probes, every file is matched against the test
+    # patterns, and .rs files under src/ (up to max_scan_bytes, 0 for no
+    # limit) are scanned for inline tests.
+    # Excluded names are pruned before descending, and symlinked directories
+    # are only followed for the top-level test dirs and src/.
+    root = os.fspath(module_path)
+    prefix_len = len(root) + len(os.sep)
+    names: Set[str] = set()
+    has_tests_dir = False
+    test_files: List[str] = []
+    rust_inline = 0
+
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        at_root = directory == root
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    follow_link = False
+                    if at_root:
+                        names.add(name)
+                        if name in TEST_DIRS and entry.is_dir():
+                            has_tests_dir = follow_link = True
+                        elif name == "src" and entry.is_dir():
+                            follow_link = True
+                    if name in excludes:
+                        continue
+                    if follow_link or entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    relative = entry.path[prefix_len:]
+                    top, sep, _ = relative.partition(os.sep)
+                    if (sep and top in TEST_DIRS) or TEST_FILE_RE.match(name):
+                        test_files.append(relative)
+                    if sep and top == "src" and name.endswith(".rs"):
+                        try:
+                            if (
+                                max_scan_bytes
+                                and not name.endswith(RUST_TEST_SOURCE_SUFFIXES)
+                                and entry.stat().st_size > max_scan_bytes
+                            ):
+                                continue
+                            if has_rust_test_marker(entry.path):
+                                rust_inline += 1
+                        except OSError:
+                            continue
+        except OSError:
             continue
-        content = read_text(path)
-        if any(marker in content for marker in RUST_INLINE_MARKERS):
-            count += 1
-    return count
-
-
-def find_test_files(module_path: Path, excludes: Iterable[str]) -> List[Path]:
-    test_files: List[Path] = []
-
-    test_dirs = ["tests", "test", "__tests__"]
-    for test_dir in test_dirs:
-        path = module_path / test_dir
-        if path.exists() and path.is_dir():
-            for file in path.rglob("*"):
-                if is_excluded(file, excludes):
-                    continue
-                if file.is_file():
-                    test_files.append(file)
 
-    test_files.extend(glob_files(module_path, PYTHON_TEST_GLOBS, excludes))
-    test_files.extend(glob_files(module_path, NODE_TEST_GLOBS, excludes))
-    test_files.extend(glob_files(module_path, GO_TEST_GLOBS, excludes))
-
-    return sorted(set(test_files))
-
-
-def build_record(module_path: Path, excludes: Iterable[str]) -> ModuleRecord:
-    test_files = find_test_files(module_path, excludes)
-    rust_inline = rust_inline_test_count(module_path, excludes)
-    test_dirs = ["tests", "test", "__tests__"]
-    has_tests_dir = any((module_path / name).exists() for name in test_dirs)
+    # Each file is visited once, so no dedup is needed. Mapping the separator
+    # to NUL makes a plain string sort match component-by-component order.
+    if sort_test_files:
+        test_files.sort(key=lambda relative: relative.replace(os.sep, "\0"))
 
     return ModuleRecord(
-        name=module_path.name,
-        path=str(module_path),
-        languages=detect_languages(module_path),
-        has_readme=(module_path / "README.md").exists(),
+        name=os.path.basename(root),
+        path=root,
+        languages=languages_from_names(names),
+        has_readme="README.md" in names,
         has_tests_dir=has_tests_dir,
-        test_files=[str(p.relative_to(module_path)) for p in test_files],
+        test_files=test_files,
         rust_inline_tests=rust_inline,
     )
 
 
-def to_markdown(rows: List[ModuleRecord], include_files: bool) -> str:
+def to_markdown(rows: Iterable[ModuleRecord], include_files: bool, out) -> None:
     header = ["Module", "Lang", "README", "Tests Dir", "Test Files", "Rust Inline"]
     if include_files:
         header.append("Test File List")
 
-    lines = ["| " + " | ".join(header) + " |", "|" + "|".join([" --- "] * len(header)) + "|"]
+    out.write("| " + " | ".join(header) + " |\n")
+    out.write("|" + "|".join([" --- "] * len(header)) + "|\n")
 
     for row in rows:
         langs = ", ".join(row.languages) if row.languages else "-"
@@ -212,35 +316,34 @@ def to_markdown(rows: List[ModuleRecord], include_files: bool) -> str:
         ]
         if include_files:
             cells.append(", ".join(row.test_files) if row.test_files else "-")
-        lines.append("| " + " | ".join(cells) + " |")
-
-    return "\n".join(lines) + "\n"
-
-
-def write_csv(rows: List[ModuleRecord], out, delimiter: str) -> None:
-    fieldnames = [
-        "module",
-        "path",
-        "languages",
-        "has_readme",
-        "has_tests_dir",
-        "test_files",
-        "rust_inline_tests",
-    ]
-    writer = csv.DictWriter(out, fieldnames=fieldnames, delimiter=delimiter)
-    writer.writeheader()
-    for row in rows:
-        writer.writerow(
-            {
-                "module": row.name,
-                "path": row.path,
-                "languages": ",".join(row.languages),
-                "has_readme": row.has_readme,
-                "has_tests_dir": row.has_tests_dir,
-                "test_files": ",".join(row.test_files),
-                "rust_inline_tests": row.rust_inline_tests,
-            }
+        out.write("| " + " | ".join(cells) + " |\n")
+
+
+def write_csv(rows: Iterable[ModuleRecord], out, delimiter: str) -> None:
+    writer = csv.writer(out, delimiter=delimiter)
+    writer.writerow(
+        (
+            "module",
+            "path",
+            "languages",
+            "has_readme",
+            "has_tests_dir",
+            "test_files",
+            "rust_inline_tests",
         )
+    )
+    writer.writerows(
+        (
+            row.name,
+            row.path,
+            ",".join(row.languages),
+            row.has_readme,
+            row.has_tests_dir,
+            ",".join(row.test_files),
+            row.rust_inline_tests,
+        )
+        for row in rows
+    )
 
 
 def main() -> int:
@@ -250,28 +353,42 @@ def main() -> int:
     excludes = set(args.excludes or [])
     if not args.no_default_excludes:
         excludes |= DEFAULT_EXCLUDES
+    excludes = frozenset(excludes)
+
+    modules = find_modules(root, excludes)
+    scan = functools.partial(
+        scan_module,
+        excludes=excludes,
+        max_scan_bytes=args.max_scan_bytes,
+        # Markdown without the file list only reports how many there are
+        sort_test_files=args.format != "markdown" or args.include_files,
+    )
+    if args.jobs is None:
+        # Scans are mostly I/O-bound; executor.map keeps them in module order
+        executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    else:
+        # Worker processes sidestep the GIL when the Rust scan is CPU-bound
+        executor = ProcessPoolExecutor(max_workers=args.jobs or None)
+    with executor:
+        records = list(executor.map(scan, sorted(modules, key=lambda p: p.name)))
 
-    modules = [
-        path for path in root.iterdir() if path.name not in excludes and is_module_dir(path)
-    ]
-    records = [build_record(path, excludes) for path in sorted(modules, key=lambda p: p.name)]
-
-    output = ""
-    if args.format == "markdown":
-        output = to_markdown(records, include_files=args.include_files)
-    elif args.format == "json":
-        output = json.dumps([record.__dict__ for record in records], indent=2)
-    elif args.format in {"csv", "tsv"}:
-        delimiter = "," if args.format == "csv" else "\t"
-        stream = open(args.out, "w", newline="", encoding="utf-8") if args.out else sys.stdout
-        with stream:
-            write_csv(records, stream, delimiter=delimiter)
-        return 0
-
+    # Every format is written straight to the destination stream
+    newline = "" if args.format in {"csv", "tsv"} else None
     if args.out:
-        Path(args.out).write_text(output, encoding="utf-8")
+        destination = open(args.out, "w", newline=newline, encoding="utf-8")
     else:
-        print(output)
+        # Leave stdout open for the caller
+        destination = contextlib.nullcontext(sys.stdout)
+    with destination as stream:
+        if args.format == "markdown":
+            to_markdown(records, include_files=args.include_files, out=stream)
+        elif args.format == "json":
+            json.dump([record._asdict() for record in records], stream, indent=2)
+        else:
+            delimiter = "," if args.format == "csv" else "\t"
+            write_csv(records, stream, delimiter=delimiter)
+        if not args.out and args.format in {"markdown", "json"}:
+            stream.write("\n")
 
     return 0
 
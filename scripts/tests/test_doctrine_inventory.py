@@ -1,6 +1,9 @@
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 import doctrine_inventory as di  # noqa: E402
@@ -27,18 +30,60 @@ def test_find_doctrine_files_dedupes(tmp_path: Path) -> None:
     assert any(path.parent.name == "docs" for path in found)
 
 
+def test_find_doctrine_files_scans_docs_tree_only(tmp_path: Path) -> None:
+    module = tmp_path / "module"
+    nested = module / "docs" / "team"
+    nested.mkdir(parents=True)
+    (nested / "api-doctrine.md").write_text("# Scope\n", encoding="utf-8")
+    src = module / "src"
+    src.mkdir()
+    (src / "doctrine.md").write_text("# Scope\n", encoding="utf-8")
+
+    found = di.find_doctrine_files(module)
+    assert found == [nested / "api-doctrine.md"]
+
+
+def test_find_doctrine_files_follows_symlinked_docs(tmp_path: Path) -> None:
+    shared = tmp_path / "shared_docs"
+    shared.mkdir()
+    (shared / "team-doctrine.md").write_text("# Scope\n", encoding="utf-8")
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    (elsewhere / "other-doctrine.md").write_text("# Scope\n", encoding="utf-8")
+    # Only the docs/ root is followed, not links nested below it
+    os.symlink(elsewhere, shared / "linked")
+    module = tmp_path / "module"
+    module.mkdir()
+    os.symlink(shared, module / "docs")
+
+    found = di.find_doctrine_files(module)
+    assert found == [module / "docs" / "team-doctrine.md"]
+
+
 def test_build_record_missing_headings(tmp_path: Path) -> None:
     module = tmp_path / "module"
     module.mkdir()
     (module / "README.md").write_text("readme", encoding="utf-8")
     (module / "Cargo.toml").write_text("[package]\nname = \"demo\"\n", encoding="utf-8")
-    (module / "DOCTRINE.md").write_text("# Purpose\n# Tenets\n", encoding="utf-8")
+    (module / "DOCTRINE.md").write_text("# Tenets\n# Purpose\n# Tenets\n", encoding="utf-8")
 
     record = di.build_record(module, ["Purpose", "Scope", "Tenets"])
     assert record.name == "module"
     assert record.has_readme is True
     assert record.languages == ["rust"]
     assert record.missing_headings == ["Scope"]
+    assert record.headings == ["Tenets", "Purpose"]
+
+
+def test_build_record_without_headings_matches_missing(tmp_path: Path) -> None:
+    module = tmp_path / "module"
+    module.mkdir()
+    (module / "DOCTRINE.md").write_text("# Purpose\n## tenets\n# Extra\n", encoding="utf-8")
+
+    full = di.build_record(module, ["Purpose", "Scope", "Tenets"])
+    fast = di.build_record(module, ["Purpose", "Scope", "Tenets"], collect_headings=False)
+    assert fast.missing_headings == full.missing_headings == ["Scope"]
+    assert fast.headings == []
 
 
 def test_to_markdown_includes_missing_headings() -> None:
@@ -56,3 +101,34 @@ def test_to_markdown_includes_missing_headings() -> None:
     output = di.to_markdown([record], include_headings=True)
     assert "Missing Headings" in output
     assert "Scope" in output
+
+
+def test_read_text_cached_rereads_after_change(tmp_path: Path) -> None:
+    doc = tmp_path / "DOCTRINE.md"
+    doc.write_text("# Purpose\n", encoding="utf-8")
+    assert di.read_text_cached(doc) is di.read_text_cached(doc)
+
+    doc.write_text("# Scope\n", encoding="utf-8")
+    stat = doc.stat()
+    os.utime(doc, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert di.read_text_cached(doc) == "# Scope\n"
+
+
+def test_dumps_json_matches_stdlib_fallback(monkeypatch) -> None:
+    # Without orjson both calls take the fallback and compare it to itself
+    pytest.importorskip("orjson")
+    data = [{"name": "démo", "headings": ["Purpose"], "has_readme": True}]
+    output = di.dumps_json(data)
+    monkeypatch.setattr(di, "orjson", None)
+    assert di.dumps_json(data) == output
+
+
+def test_find_modules_skips_excluded_and_hidden(tmp_path: Path) -> None:
+    for name in ["alpha", "notes", ".hidden", "plain"]:
+        (tmp_path / name).mkdir()
+    for name in ["alpha", "notes", ".hidden"]:
+        (tmp_path / name / "README.md").write_text("readme", encoding="utf-8")
+    (tmp_path / "README.md").write_text("root file", encoding="utf-8")
+
+    modules = di.find_modules(tmp_path, {"notes"})
+    assert modules == [tmp_path / "alpha"]
@@ -1,39 +1,234 @@
+import argparse
+import json
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 import test_inventory as ti  # noqa: E402
 
 
-def test_is_module_dir_with_readme(tmp_path: Path) -> None:
+def test_find_modules_with_readme(tmp_path: Path) -> None:
     module = tmp_path / "module"
     module.mkdir()
     (module / "README.md").write_text("readme", encoding="utf-8")
-    assert ti.is_module_dir(module) is True
+    assert ti.find_modules(tmp_path, set()) == [module]
 
 
-def test_detect_languages_rust(tmp_path: Path) -> None:
+def test_scan_module_detects_rust(tmp_path: Path) -> None:
     module = tmp_path / "module"
     module.mkdir()
     (module / "Cargo.toml").write_text("[package]\nname = \"demo\"\n", encoding="utf-8")
-    assert ti.detect_languages(module) == ["rust"]
+    assert ti.scan_module(module, set()).languages == ["rust"]
 
 
-def test_rust_inline_test_count(tmp_path: Path) -> None:
+def test_scan_module_counts_rust_inline_tests(tmp_path: Path) -> None:
     module = tmp_path / "module"
     src = module / "src"
     src.mkdir(parents=True)
     (src / "lib.rs").write_text("#[test]\nfn it_works() {}\n", encoding="utf-8")
-    assert ti.rust_inline_test_count(module, []) == 1
+    assert ti.scan_module(module, []).rust_inline_tests == 1
 
 
-def test_find_test_files_in_tests_dir(tmp_path: Path) -> None:
+def test_scan_module_finds_files_in_tests_dir(tmp_path: Path) -> None:
     module = tmp_path / "module"
     tests_dir = module / "tests"
     tests_dir.mkdir(parents=True)
     test_file = tests_dir / "test_sample.py"
     test_file.write_text("def test_ok():\n    assert True\n", encoding="utf-8")
 
-    files = ti.find_test_files(module, [])
-    assert test_file in files
+    files = ti.scan_module(module, []).test_files
+    assert str(test_file.relative_to(module)) in files
+
+
+def test_scan_module_prunes_excluded_dirs(tmp_path: Path) -> None:
+    module = tmp_path / "module"
+    vendored = module / "node_modules" / "dep"
+    vendored.mkdir(parents=True)
+    (vendored / "index.test.js").write_text("", encoding="utf-8")
+    (module / "app.test.js").write_text("", encoding="utf-8")
+
+    files = ti.scan_module(module, {"node_modules"}).test_files
+    assert files == ["app.test.js"]
+
+
+def test_find_modules_skips_hidden_and_excluded(tmp_path: Path) -> None:
+    for name in ("module", ".hidden", "build", "plain"):
+        (tmp_path / name).mkdir()
+    for name in ("module", ".hidden", "build"):
+        (tmp_path / name / "README.md").write_text("readme", encoding="utf-8")
+
+    assert ti.find_modules(tmp_path, {"build"}) == [tmp_path / "module"]
+
+
+def test_scan_module_collects_all_facts(tmp_path: Path) -> None:
+    module = tmp_path / "module"
+    (module / "src").mkdir(parents=True)
+    (module / "tests").mkdir()
+    (module / "Cargo.toml").write_text("[package]\n", encoding="utf-8")
+    (module / "README.md").write_text("readme", encoding="utf-8")
+    (module / "src" / "lib.rs").write_text("#[cfg(test)]\nmod tests {}\n", encoding="utf-8")
+    (module / "tests" / "integration.rs").write_text("#[test]\nfn ok() {}\n", encoding="utf-8")
+
+    record = ti.scan_module(module, set())
+    assert record.languages == ["rust"]
+    assert record.has_readme is True
+    assert record.has_tests_dir is True
+    assert record.test_files == [str(Path("tests") / "integration.rs")]
+    assert record.rust_inline_tests == 1
+
+
+def test_scan_module_reports_paths_relative_to_module(tmp_path: Path) -> None:
+    module = tmp_path / "module"
+    nested = module / "pkg" / "sub"
+    nested.mkdir(parents=True)
+    (nested / "test_deep.py").write_text("", encoding="utf-8")
+    (module / "test_top.py").write_text("", encoding="utf-8")
+
+    record = ti.scan_module(module, set())
+    assert record.test_files == [
+        str(Path("pkg") / "sub" / "test_deep.py"),
+        "test_top.py",
+    ]
+
+
+def test_scan_module_keeps_declared_language_order(tmp_path: Path) -> None:
+    module = tmp_path / "module"
+    module.mkdir()
+    for marker in ("go.mod", "requirements.txt", "pyproject.toml", "Cargo.toml"):
+        (module / marker).write_text("", encoding="utf-8")
+    assert ti.scan_module(module, set()).languages == ["rust", "python", "go"]
+
+
+def test_scan_module_sorts_by_path_components(tmp_path: Path) -> None:
+    module = tmp_path / "module"
+    for directory in ("a", "a.b", "a-b"):
+        (module / directory).mkdir(parents=True)
+        (module / directory / "test_x.py").write_text("", encoding="utf-8")
+
+    record = ti.scan_module(module, set())
+    expected = sorted(Path(directory) / "test_x.py" for directory in ("a", "a.b", "a-b"))
+    assert record.test_files == [str(path) for path in expected]
+
+
+def test_rust_marker_split_across_reads(tmp_path: Path) -> None:
+    source = tmp_path / "lib.rs"
+    padding = b" " * (ti.READ_CHUNK_SIZE - 3)
+    source.write_bytes(padding + b"#[cfg(test)]\n")
+    assert ti.has_rust_test_marker(str(source)) is True
+
+    source.write_bytes(padding + b"fn main() {}\n")
+    assert ti.has_rust_test_marker(str(source)) is False
+
+
+def test_scan_module_skips_large_rust_sources(tmp_path: Path) -> None:
+    module = tmp_path / "module"
+    src = module / "src"
+    src.mkdir(parents=True)
+    body = b"#[test]\nfn ok() {}\n" + b"//" * 64
+    (src / "generated.rs").write_bytes(body)
+    (src / "tests.rs").write_bytes(body)
+
+    assert ti.scan_module(module, set(), max_scan_bytes=16).rust_inline_tests == 1
+    assert ti.scan_module(module, set(), max_scan_bytes=0).rust_inline_tests == 2
+
+
+def test_scan_module_ignores_test_named_files(tmp_path: Path) -> None:
+    module = tmp_path / "module"
+    module.mkdir()
+    (module / "test").write_text("not a directory", encoding="utf-8")
+    assert ti.scan_module(module, set()).has_tests_dir is False
+
+
+def test_scan_module_follows_symlinked_tests_dir(tmp_path: Path) -> None:
+    shared = tmp_path / "shared_tests"
+    shared.mkdir()
+    (shared / "check.py").write_text("", encoding="utf-8")
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    (elsewhere / "test_other.py").write_text("", encoding="utf-8")
+    # Only the top-level test dir link is followed, not links nested below it
+    os.symlink(elsewhere, shared / "linked")
+    module = tmp_path / "module"
+    module.mkdir()
+    os.symlink(shared, module / "tests")
+
+    record = ti.scan_module(module, set())
+    assert record.has_tests_dir is True
+    assert record.test_files == [str(Path("tests") / "check.py")]
+
+
+def test_scan_module_follows_symlinked_src(tmp_path: Path) -> None:
+    real_src = tmp_path / "real_src"
+    real_src.mkdir()
+    (real_src / "lib.rs").write_text("#[test]\nfn ok() {}\n", encoding="utf-8")
+    module = tmp_path / "module"
+    module.mkdir()
+    os.symlink(real_src, module / "src")
+
+    assert ti.scan_module(module, set()).rust_inline_tests == 1
+
+
+def test_non_negative_int_rejects_negative_values() -> None:
+    assert ti.non_negative_int("0") == 0
+    assert ti.non_negative_int("512") == 512
+    for value in ("-1", "x"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            ti.non_negative_int(value)
+
+
+def make_inventory_tree(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    module = root / "module"
+    (module / "src").mkdir(parents=True)
+    (module / "tests").mkdir()
+    (module / "Cargo.toml").write_text("[package]\n", encoding="utf-8")
+    (module / "src" / "lib.rs").write_text("#[test]\nfn ok() {}\n", encoding="utf-8")
+    (module / "tests" / "test_api.py").write_text("", encoding="utf-8")
+    return root
+
+
+def run_main(monkeypatch, *args: str) -> int:
+    monkeypatch.setattr(sys, "argv", ["test_inventory.py", *args])
+    return ti.main()
+
+
+def test_main_writes_to_stdout_and_leaves_it_open(tmp_path: Path, monkeypatch, capsys) -> None:
+    root = make_inventory_tree(tmp_path)
+    assert run_main(monkeypatch, "--root", str(root), "--format", "json") == 0
+
+    records = json.loads(capsys.readouterr().out)
+    assert [record["name"] for record in records] == ["module"]
+    assert records[0]["test_files"] == [str(Path("tests") / "test_api.py")]
+    assert records[0]["rust_inline_tests"] == 1
+    assert not sys.stdout.closed
+
+
+def test_main_writes_out_file(tmp_path: Path, monkeypatch, capsys) -> None:
+    root = make_inventory_tree(tmp_path)
+    run_main(monkeypatch, "--root", str(root), "--format", "markdown")
+    printed = capsys.readouterr().out
+
+    out = tmp_path / "inventory.md"
+    run_main(monkeypatch, "--root", str(root), "--format", "markdown", "--out", str(out))
+    assert capsys.readouterr().out == ""
+    # stdout gets the extra trailing newline print() used to add
+    assert out.read_text(encoding="utf-8") + "\n" == printed
+    assert "| module | rust | no | yes | 1 | 1 |" in printed
+
+
+def test_main_jobs_matches_thread_pool_output(tmp_path: Path, monkeypatch, capsys) -> None:
+    root = make_inventory_tree(tmp_path)
+    other = root / "other"
+    other.mkdir()
+    (other / "package.json").write_text("{}", encoding="utf-8")
+    (other / "app.test.js").write_text("", encoding="utf-8")
+
+    run_main(monkeypatch, "--root", str(root), "--format", "json")
+    threaded = capsys.readouterr().out
+    run_main(monkeypatch, "--root", str(root), "--format", "json", "--jobs", "1")
+    assert capsys.readouterr().out == threaded
+    assert [record["name"] for record in json.loads(threaded)] == ["module", "other"]